@@ -1,6 +1,41 @@
 import numpy as np
+import matplotlib
+matplotlib.use("Agg") # Backend sem janela: os gráficos são apenas salvos em arquivo
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import os
+import hashlib
+import inspect
+import tempfile
+import zipfile
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import numba
+except ImportError: # Numba é opcional; sem ele o laço roda em Python puro
+    numba = None
+
+# Laço paralelo do Numba; sem ele, um range comum
+prange = numba.prange if numba is not None else range
+
+# Simplificação de caminhos com o limiar padrão (1/9): o Agg descarta vértices
+# redundantes sem alterar visualmente as curvas. Limiares maiores deixam as
+# partes íngremes de S, I e R facetadas.
+plt.rcParams['path.simplify'] = True
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Opções de gravação dos PNGs: compressão zlib mínima (a codificação domina o
+# tempo de gravação), sem bbox_inches='tight' (evitaria uma segunda renderização)
+SAVEFIG_KWARGS = {
+    "dpi": 100,
+    "pil_kwargs": {"compress_level": 1},
+    "metadata": {"Software": None},
+}
+
+# Diretório do cache de resultados (.npz) das simulações
+CACHE_DIR = os.path.join("data_output", ".cache")
 
 # --- Parâmetros de Simulação ---
 # N: População Total
@@ -61,9 +96,232 @@ datas = [
     }
 ]
 
-def run_sir_model(N, I0, R0_param, beta, gamma, total_time, time_steps, intervencao_dia=None, beta_pos_intervencao=None):
+def _jit(func=None, parallel=False):
+    """
+    Compila a função com o Numba quando disponível; caso contrário, devolve-a intacta.
+
+    Pode ser usado como `@_jit` ou `@_jit(parallel=True)`.
+    """
+    if func is None:
+        return lambda f: _jit(f, parallel=parallel)
+    if numba is None:
+        return func
+    return numba.njit(cache=True, fastmath=True, parallel=parallel)(func)
+
+@_jit
+def _f(s, i, beta_, gamma_, inv_N):
+    """
+    Derivadas do sistema SIR: retorna (dS/dt, dI/dt, dR/dt).
+
+    inv_N é 1/N, pré-calculado pelo chamador (multiplicação no lugar de divisão).
     """
-    Executa a simulação do Modelo SIR usando o método de Euler.
+    infeccao = beta_ * s * i * inv_N
+    recuperacao = gamma_ * i
+    return -infeccao, infeccao - recuperacao, recuperacao
+
+def _beta_schedule(t, beta, intervencao_dia=None, beta_pos_intervencao=None):
+    """
+    Retorna o valor de beta em cada passo (array de tamanho len(t) - 1).
+
+    A troca de beta na intervenção é resolvida aqui, fora do laço de integração,
+    para que os núcleos não precisem de nenhum desvio condicional.
+    """
+    if intervencao_dia is not None and beta_pos_intervencao is None:
+        raise ValueError("beta_pos_intervencao é obrigatório quando intervencao_dia é informado.")
+
+    beta_t = np.full(len(t) - 1, beta, dtype=np.float64)
+    if intervencao_dia is not None:
+        k = int(np.searchsorted(t[:-1], intervencao_dia))
+        beta_t[k:] = beta_pos_intervencao
+    return beta_t
+
+def _sir_euler(N, I0, R0_param, beta_t, gamma, dt, T):
+    """
+    Núcleo do método de Euler, escrito apenas com escalares e arrays numéricos
+    para poder ser compilado pelo Numba.
+
+    beta_t[i] é a taxa de transmissão usada no passo i.
+    """
+    S = np.empty(T + 1, dtype=np.float64)
+    I = np.empty(T + 1, dtype=np.float64)
+    R = np.empty(T + 1, dtype=np.float64)
+
+    # Estado corrente mantido em escalares (evita indexação no laço)
+    s = N - I0 - R0_param
+    i_ = I0
+    S[0] = s
+    I[0] = i_
+    R[0] = R0_param
+
+    # Constantes do passo, calculadas uma única vez
+    inv_N = 1.0 / N
+    gamma_dt = gamma * dt
+
+    for i in range(T):
+        current_beta = beta_t[i]
+
+        # Fluxos do passo (o termo de infecção é calculado uma única vez)
+        # dS/dt = - beta * S * I / N
+        # dI/dt = (beta * S * I / N) - gamma * I
+        flux = current_beta * s * i_ * inv_N * dt
+        rec = gamma_dt * i_
+
+        # Atualização dos compartimentos para o próximo passo
+        s = s - flux
+        i_ = i_ + (flux - rec)
+
+        # Manter S e I em [0, N] (correção numérica); sob o Numba, min/max de
+        # floats viram instruções sem desvio
+        s = min(max(s, 0.0), N)
+        i_ = min(max(i_, 0.0), N)
+
+        S[i+1] = s
+        I[i+1] = i_
+        # Conservação da população: R = N - S - I
+        R[i+1] = N - s - i_
+
+    return S, I, R
+
+_sir_euler_njit = _jit(_sir_euler)
+
+def _sir_euler_const_beta(N, I0, R0_param, beta, gamma, dt, T):
+    """
+    Variante de `_sir_euler` para beta constante (sem intervenção): o laço não
+    lê nenhum array de beta e o fator beta * dt / N é calculado uma única vez.
+    """
+    S = np.empty(T + 1, dtype=np.float64)
+    I = np.empty(T + 1, dtype=np.float64)
+    R = np.empty(T + 1, dtype=np.float64)
+
+    s = N - I0 - R0_param
+    i_ = I0
+    S[0] = s
+    I[0] = i_
+    R[0] = R0_param
+
+    beta_dt_over_N = beta * dt / N
+    gamma_dt = gamma * dt
+
+    for i in range(T):
+        flux = beta_dt_over_N * s * i_
+        rec = gamma_dt * i_
+
+        s = s - flux
+        i_ = i_ + (flux - rec)
+
+        # Manter S e I em [0, N] (correção numérica)
+        s = min(max(s, 0.0), N)
+        i_ = min(max(i_, 0.0), N)
+
+        S[i+1] = s
+        I[i+1] = i_
+        R[i+1] = N - s - i_
+
+    return S, I, R
+
+_sir_euler_const_beta_njit = _jit(_sir_euler_const_beta)
+
+def _sir_rk4(N, I0, R0_param, beta_t, gamma, dt, T):
+    """
+    Núcleo do método de Runge-Kutta de 4ª ordem (RK4).
+
+    O erro global é O(dt^4) e S+I+R = N é preservado até o arredondamento,
+    por isso não há correção nem normalização a cada passo.
+    beta_t[i] é a taxa de transmissão usada no passo i.
+    """
+    S = np.empty(T + 1, dtype=np.float64)
+    I = np.empty(T + 1, dtype=np.float64)
+    R = np.empty(T + 1, dtype=np.float64)
+
+    S[0] = N - I0 - R0_param
+    I[0] = I0
+    R[0] = R0_param
+
+    inv_N = 1.0 / N
+
+    for i in range(T):
+        # beta é constante dentro de cada passo
+        current_beta = beta_t[i]
+
+        s, i_, r = S[i], I[i], R[i]
+        k1S, k1I, k1R = _f(s, i_, current_beta, gamma, inv_N)
+        k2S, k2I, k2R = _f(s + 0.5 * dt * k1S, i_ + 0.5 * dt * k1I, current_beta, gamma, inv_N)
+        k3S, k3I, k3R = _f(s + 0.5 * dt * k2S, i_ + 0.5 * dt * k2I, current_beta, gamma, inv_N)
+        k4S, k4I, k4R = _f(s + dt * k3S, i_ + dt * k3I, current_beta, gamma, inv_N)
+
+        S[i+1] = s + dt * (k1S + 2 * k2S + 2 * k3S + k4S) / 6
+        I[i+1] = i_ + dt * (k1I + 2 * k2I + 2 * k3I + k4I) / 6
+        R[i+1] = r + dt * (k1R + 2 * k2R + 2 * k3R + k4R) / 6
+
+    return S, I, R
+
+_sir_rk4_njit = _jit(_sir_rk4)
+
+@lru_cache(maxsize=None)
+def _cache_version():
+    """
+    Versão do código de integração, incluída na chave do cache.
+
+    É um hash do código-fonte das funções que produzem os resultados (e de o
+    Numba estar ou não disponível), então qualquer mudança nelas invalida o
+    cache automaticamente.
+    """
+    funcs = (
+        _f, _beta_schedule, _sir_euler, _sir_euler_const_beta, _sir_rk4,
+        _sir_batch_numpy, _integrate_lane, _batched_sir, _batched_sir_parallel,
+    )
+    partes = [repr(numba is None)]
+    for func in funcs:
+        partes.append(inspect.getsource(getattr(func, "py_func", func)))
+    return hashlib.sha1("".join(partes).encode()).hexdigest()[:16]
+
+def _cache_path(params):
+    """
+    Caminho do arquivo de cache para um dicionário de parâmetros de simulação.
+    """
+    params = dict(params, versao=_cache_version())
+    key = hashlib.sha1(repr(tuple(sorted(params.items()))).encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{key}.npz")
+
+def _load_cached(path):
+    """
+    Retorna (t, S, I, R) salvos em `path`, ou None se não houver cache.
+
+    Um arquivo ilegível ou incompleto é tratado como ausência de cache.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as cached:
+            return cached["t"], cached["S"], cached["I"], cached["R"]
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        return None
+
+def _save_cached(path, t, S, I, R):
+    """
+    Salva (t, S, I, R) em `path`, escrevendo antes num arquivo temporário único
+    (execuções simultâneas não compartilham o mesmo temporário).
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            np.savez_compressed(f, t=t, S=S, I=I, R=R)
+        except BaseException:
+            f.close()
+            os.remove(tmp_path)
+            raise
+    os.replace(tmp_path, path)
+
+def _as_dtype(dtype, *arrays):
+    """
+    Converte os arrays de resultado (calculados em float64) para `dtype`.
+    """
+    return tuple(a.astype(dtype, copy=False) for a in arrays)
+
+def run_sir_model(N, I0, R0_param, beta, gamma, total_time, time_steps, intervencao_dia=None, beta_pos_intervencao=None, method="rk4", dtype=np.float64, cache=False):
+    """
+    Executa a simulação do Modelo SIR (RK4 por padrão, ou Euler).
 
     Argumentos:
         N: População total.
@@ -75,6 +333,12 @@ def run_sir_model(N, I0, R0_param, beta, gamma, total_time, time_steps, interven
         time_steps: Número de passos de tempo.
         intervencao_dia: (Opcional) Dia em que beta muda.
         beta_pos_intervencao: (Opcional) Nova taxa beta após a intervenção.
+        method: Integrador: "rk4" (padrão) ou "euler" (comportamento antigo).
+        dtype: Tipo dos arrays retornados (padrão float64). A integração é sempre
+            feita em float64; np.float32 apenas converte o resultado no final,
+            reduzindo à metade a memória ocupada por ele.
+        cache: Se True, reaproveita o resultado salvo em CACHE_DIR para os mesmos
+            parâmetros (ou salva-o após simular).
 
     Retorna:
         t: Array de tempo.
@@ -83,128 +347,350 @@ def run_sir_model(N, I0, R0_param, beta, gamma, total_time, time_steps, interven
         R: Array de Recuperados.
     """
     
+    # Sem intervenção, o Euler usa o núcleo especializado para beta constante
+    if method == "rk4":
+        kernel = _sir_rk4_njit
+    elif method == "euler":
+        kernel = _sir_euler_njit if intervencao_dia is not None else _sir_euler_const_beta_njit
+    else:
+        raise ValueError(f"Método de integração desconhecido: {method!r}")
+
+    if cache:
+        cache_path = _cache_path({
+            "funcao": "run_sir_model",
+            "N": N, "I0": I0, "R0_param": R0_param, "beta": beta, "gamma": gamma,
+            "total_time": total_time, "time_steps": time_steps,
+            "intervencao_dia": intervencao_dia, "beta_pos_intervencao": beta_pos_intervencao,
+            "method": method, "dtype": np.dtype(dtype).name,
+        })
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return cached
+
     # 1. Inicialização
     dt = total_time / time_steps
-    t = np.linspace(0, total_time, time_steps + 1)
-    
-    # Condições iniciais
-    I = np.zeros(time_steps + 1)
-    R = np.zeros(time_steps + 1)
-    S = np.zeros(time_steps + 1)
+    t = np.arange(time_steps + 1, dtype=np.float64) * dt
 
-    I[0] = I0
-    R[0] = R0_param
-    S[0] = N - I0 - R0_param
+    if kernel is _sir_euler_const_beta_njit:
+        beta_arg = float(beta)
+    else:
+        beta_arg = _beta_schedule(t, beta, intervencao_dia, beta_pos_intervencao)
 
-    # 2. Resolução do sistema de equações (Euler Forward)
-    for i in range(time_steps):
-        # Verifica a intervenção para mudar beta dinamicamente
-        current_beta = beta
-        if intervencao_dia is not None and t[i] >= intervencao_dia:
-            current_beta = beta_pos_intervencao
-            
-        # Cálculo das mudanças (Derivadas)
-        # dS/dt = - beta * S * I / N
-        d_S = -current_beta * S[i] * I[i] / N
-        # dI/dt = (beta * S * I / N) - gamma * I
-        d_I = (current_beta * S[i] * I[i] / N) - gamma * I[i]
-        # dR/dt = gamma * I
-        d_R = gamma * I[i]
+    # 2. Resolução do sistema de equações
+    S, I, R = kernel(
+        float(N), float(I0), float(R0_param), beta_arg, float(gamma),
+        float(dt), int(time_steps)
+    )
+    t, S, I, R = _as_dtype(dtype, t, S, I, R)
 
-        # Atualização dos compartimentos para o próximo passo
-        S[i+1] = S[i] + d_S * dt
-        I[i+1] = I[i] + d_I * dt
-        R[i+1] = R[i] + d_R * dt
-        
-        # Garantir que as populações não sejam negativas (correção numérica)
-        S[i+1] = max(0, S[i+1])
-        I[i+1] = max(0, I[i+1])
-        R[i+1] = min(N, R[i+1]) # R não pode ser maior que N
-
-        # Normalização (S+I+R = N) devido a erros numéricos no Euler
-        total = S[i+1] + I[i+1] + R[i+1]
-        if total != N and total > 0:
-             fator = N / total
-             S[i+1] *= fator
-             I[i+1] *= fator
-             R[i+1] *= fator
+    if cache:
+        _save_cached(cache_path, t, S, I, R)
+
+    return t, S, I, R
+
+def _sir_batch_numpy(N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, T, rk4):
+    """
+    Avança os K cenários em conjunto: cada passo é uma operação NumPy sobre
+    vetores de tamanho K. Usado quando o Numba não está disponível.
+    """
+    K = N_vec.shape[0]
+    inv_N_vec = 1.0 / N_vec
+
+    S = np.empty((T + 1, K), dtype=np.float64)
+    I = np.empty((T + 1, K), dtype=np.float64)
+    R = np.empty((T + 1, K), dtype=np.float64)
+
+    I[0] = I0_vec
+    R[0] = R0_vec
+    S[0] = N_vec - I0_vec - R0_vec
+
+    for i in range(T):
+        cb = beta_t[i]
+
+        if not rk4:
+            infect = cb * S[i] * I[i] * inv_N_vec
+            rec = gamma_vec * I[i]
+            S[i+1] = np.clip(S[i] - infect * dt, 0.0, N_vec)
+            I[i+1] = np.clip(I[i] + (infect - rec) * dt, 0.0, N_vec)
+            R[i+1] = N_vec - S[i+1] - I[i+1]
+        else:
+            k1S, k1I, k1R = _f(S[i], I[i], cb, gamma_vec, inv_N_vec)
+            k2S, k2I, k2R = _f(S[i] + 0.5 * dt * k1S, I[i] + 0.5 * dt * k1I, cb, gamma_vec, inv_N_vec)
+            k3S, k3I, k3R = _f(S[i] + 0.5 * dt * k2S, I[i] + 0.5 * dt * k2I, cb, gamma_vec, inv_N_vec)
+            k4S, k4I, k4R = _f(S[i] + dt * k3S, I[i] + dt * k3I, cb, gamma_vec, inv_N_vec)
+
+            S[i+1] = S[i] + dt * (k1S + 2 * k2S + 2 * k3S + k4S) / 6
+            I[i+1] = I[i] + dt * (k1I + 2 * k2I + 2 * k3I + k4I) / 6
+            R[i+1] = R[i] + dt * (k1R + 2 * k2R + 2 * k3R + k4R) / 6
+
+    return S, I, R
+
+@_jit
+def _integrate_lane(k, N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, T, rk4, S, I, R):
+    """
+    Integra o cenário k por inteiro e grava o resultado na coluna k de S, I e R.
+    """
+    beta_k = np.ascontiguousarray(beta_t[:, k])
+    if rk4:
+        S_k, I_k, R_k = _sir_rk4_njit(N_vec[k], I0_vec[k], R0_vec[k], beta_k, gamma_vec[k], dt, T)
+    else:
+        S_k, I_k, R_k = _sir_euler_njit(N_vec[k], I0_vec[k], R0_vec[k], beta_k, gamma_vec[k], dt, T)
+    S[:, k] = S_k
+    I[:, k] = I_k
+    R[:, k] = R_k
+
+@_jit
+def _batched_sir(N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, T, rk4):
+    """
+    Versão Numba de `_sir_batch_numpy`: os cenários são independentes, então
+    cada um é integrado por inteiro, um após o outro.
+    """
+    K = N_vec.shape[0]
+
+    S = np.empty((T + 1, K), dtype=np.float64)
+    I = np.empty((T + 1, K), dtype=np.float64)
+    R = np.empty((T + 1, K), dtype=np.float64)
+
+    for k in range(K):
+        _integrate_lane(k, N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, T, rk4, S, I, R)
+
+    return S, I, R
+
+@_jit(parallel=True)
+def _batched_sir_parallel(N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, T, rk4):
+    """
+    Como `_batched_sir`, mas com prange sobre o eixo K (um cenário por thread).
+
+    Só compensa para ensembles grandes; com poucos cenários o custo de iniciar
+    o pool de threads do Numba supera o ganho.
+    """
+    K = N_vec.shape[0]
+
+    S = np.empty((T + 1, K), dtype=np.float64)
+    I = np.empty((T + 1, K), dtype=np.float64)
+    R = np.empty((T + 1, K), dtype=np.float64)
+
+    for k in prange(K):
+        _integrate_lane(k, N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, T, rk4, S, I, R)
+
+    return S, I, R
+
+def _run_batched(N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, T, method, parallel=False):
+    """
+    Escolhe o núcleo em lote: Numba (paralelo se `parallel`), ou NumPy em passo único.
+    """
+    if method not in ("rk4", "euler"):
+        raise ValueError(f"Método de integração desconhecido: {method!r}")
+
+    if numba is None:
+        kernel = _sir_batch_numpy
+    elif parallel:
+        kernel = _batched_sir_parallel
+    else:
+        kernel = _batched_sir
+    return kernel(
+        N_vec, I0_vec, R0_vec, beta_t, gamma_vec, float(dt), int(T), method == "rk4"
+    )
+
+def run_sir_batch(datas, method="rk4", dtype=np.float64, cache=False):
+    """
+    Executa vários cenários SIR de uma só vez, avançando todos em conjunto.
 
+    Os parâmetros são guardados como estrutura de arrays (um vetor de tamanho K
+    por parâmetro). Todos os cenários precisam ter o mesmo total_time e time_steps.
+
+    Argumentos:
+        datas: Lista de dicionários de cenário (mesmas chaves de `datas`).
+        method: Integrador: "rk4" (padrão) ou "euler".
+        dtype: Tipo dos arrays retornados (veja `run_sir_model`).
+        cache: Reaproveita resultados salvos em disco (veja `run_sir_model`).
+
+    Retorna:
+        t: Array de tempo, forma (T+1,).
+        S, I, R: Arrays de forma (T+1, K), uma coluna por cenário.
+    """
+    total_time = datas[0]["total_time"]
+    time_steps = datas[0]["time_steps"]
+    if any(d["total_time"] != total_time or d["time_steps"] != time_steps for d in datas):
+        raise ValueError("Todos os cenários precisam ter o mesmo total_time e time_steps.")
+
+    if cache:
+        # Apenas os parâmetros que afetam a simulação (nome e cor não entram na chave)
+        chaves = ("N", "I0", "R0_param", "beta", "gamma", "total_time", "time_steps",
+                  "intervencao_dia", "beta_pos_intervencao")
+        cache_path = _cache_path({
+            "funcao": "run_sir_batch",
+            "cenarios": tuple(tuple(d.get(c) for c in chaves) for d in datas),
+            "method": method, "dtype": np.dtype(dtype).name,
+        })
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return cached
+
+    dt = total_time / time_steps
+    t = np.arange(time_steps + 1, dtype=np.float64) * dt
+
+    # Parâmetros de cada cenário como vetores de tamanho K
+    N_vec = np.array([d["N"] for d in datas], dtype=np.float64)
+    I0_vec = np.array([d["I0"] for d in datas], dtype=np.float64)
+    R0_vec = np.array([d["R0_param"] for d in datas], dtype=np.float64)
+    gamma_vec = np.array([d["gamma"] for d in datas], dtype=np.float64)
+    # beta de cada cenário em cada passo, forma (T, K)
+    beta_t = np.column_stack([
+        _beta_schedule(t, d["beta"], d.get("intervencao_dia"), d.get("beta_pos_intervencao"))
+        for d in datas
+    ])
+
+    S, I, R = _run_batched(N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, time_steps, method)
+    t, S, I, R = _as_dtype(dtype, t, S, I, R)
+
+    if cache:
+        _save_cached(cache_path, t, S, I, R)
 
     return t, S, I, R
 
-def plot_single_sir_curve(t, S, I, R, data, output_dir, filename):
+def run_sir_ensemble(N, I0, R0_param, beta, gamma, total_time, time_steps, intervencao_dia=None, beta_pos_intervencao=None, method="rk4", dtype=np.float64):
+    """
+    Executa um conjunto (ensemble) de simulações SIR, por exemplo para Monte Carlo
+    sobre parâmetros incertos.
+
+    Os argumentos são os mesmos de `run_sir_model`, mas N, I0, R0_param, beta,
+    gamma e beta_pos_intervencao podem ser arrays de tamanho M (um valor por
+    membro do ensemble); escalares são repetidos para todos os membros. Com o
+    Numba, os membros são integrados em paralelo.
+
+    Retorna:
+        t: Array de tempo, forma (T+1,).
+        S, I, R: Arrays de forma (T+1, M), uma coluna por membro.
+    """
+    dt = total_time / time_steps
+    t = np.arange(time_steps + 1, dtype=np.float64) * dt
+
+    if intervencao_dia is not None and beta_pos_intervencao is None:
+        raise ValueError("beta_pos_intervencao é obrigatório quando intervencao_dia é informado.")
+
+    params = [N, I0, R0_param, beta, gamma]
+    if intervencao_dia is not None:
+        params.append(beta_pos_intervencao)
+    params = np.broadcast_arrays(*[np.atleast_1d(np.asarray(p, dtype=np.float64)) for p in params])
+    N_vec, I0_vec, R0_vec, beta_vec, gamma_vec = [np.ascontiguousarray(p) for p in params[:5]]
+
+    # beta de cada membro em cada passo, forma (T, M)
+    beta_t = np.tile(beta_vec, (time_steps, 1))
+    if intervencao_dia is not None:
+        k = int(np.searchsorted(t[:-1], intervencao_dia))
+        beta_t[k:] = params[5]
+
+    S, I, R = _run_batched(N_vec, I0_vec, R0_vec, beta_t, gamma_vec, dt, time_steps, method, parallel=True)
+
+    return _as_dtype(dtype, t, S, I, R)
+
+def plot_single_sir_curve(t, S, I, R, data, output_dir, filename, ax=None):
     """
     Plota as curvas S, I e R para um único cenário (gráfico individual).
+
+    Se `ax` for informado, os eixos são limpos e reaproveitados (junto com a
+    figura) em vez de criar e fechar uma figura nova a cada chamada.
     """
-    plt.figure(figsize=(10, 6))
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(10, 6))
+    else:
+        fig = ax.figure
+        ax.cla()
     
     # Calcular R0 inicial
     R0_calc = data["beta"] / data["gamma"]
     
-    plt.plot(t, S, color='blue', linewidth=2, label='Suscetíveis (S)')
-    plt.plot(t, I, color='red', linewidth=2, label='Infectados (I)')
-    plt.plot(t, R, color='green', linewidth=2, label='Recuperados (R)')
+    ax.plot(t, S, color='blue', linewidth=2, label='Suscetíveis (S)')
+    ax.plot(t, I, color='red', linewidth=2, label='Infectados (I)')
+    ax.plot(t, R, color='green', linewidth=2, label='Recuperados (R)')
     
     # Adicionar linha vertical para intervenção, se aplicável
     if data.get("intervencao_dia"):
-        plt.axvline(x=data["intervencao_dia"], color='orange', linestyle='--', 
-                    label='Início da Intervenção')
-
-    plt.title(f'Modelo SIR: {data["nome"]} (R0 inicial ≈ {R0_calc:.1f})', fontsize=14)
-    plt.xlabel('Tempo (Dias)', fontsize=12)
-    plt.ylabel('População', fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.legend(loc='center right')
-    plt.ylim(bottom=0, top=data["N"] * 1.05)
-    plt.xlim(left=0)
+        ax.axvline(x=data["intervencao_dia"], color='orange', linestyle='--', 
+                   label='Início da Intervenção')
+
+    ax.set_title(f'Modelo SIR: {data["nome"]} (R0 inicial ≈ {R0_calc:.1f})', fontsize=14)
+    ax.set_xlabel('Tempo (Dias)', fontsize=12)
+    ax.set_ylabel('População', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend(loc='center right')
+    ax.set_ylim(bottom=0, top=data["N"] * 1.05)
+    ax.set_xlim(left=0)
     
     # Salvar a figura
     filepath = os.path.join(output_dir, filename)
-    plt.savefig(filepath)
-    plt.close()
+    fig.savefig(filepath, **SAVEFIG_KWARGS)
+    if own_figure:
+        plt.close(fig)
     print(f"Gráfico individual salvo em: {filepath}")
 
-def plot_sir_comparison(results, N, output_dir, filename="sir_comparison.png"):
+def plot_sir_comparison(results, N, output_dir, filename="sir_comparison.png", ax=None):
     """
     Plota as curvas de Infectados (I) de múltiplos cenários para comparação.
+
+    As curvas são desenhadas como um único LineCollection e os picos como um
+    único scatter, então o custo não cresce com um artista por cenário. Todos
+    os resultados devem compartilhar o mesmo eixo de tempo.
+    Assim como em `plot_single_sir_curve`, `ax` permite reaproveitar uma figura.
     """
-    plt.figure(figsize=(12, 6))
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(12, 6))
+    else:
+        fig = ax.figure
+        ax.cla()
     
     # Plotar apenas a curva I (Infectados) para comparação
-    for result in results:
-        t, S, I, R = result["t"], result["S"], result["I"], result["R"]
-        label = result["nome"]
-        cor = result["cor"]
-        
-        # Calcular o R0 inicial para o título
-        beta_inicial = result["beta"]
-        gamma = result["gamma"]
-        R0_calc = beta_inicial / gamma
-        
-        plt.plot(t, I, color=cor, linewidth=3, 
-                 label=f'{label} ($R_0$ inicial ≈ {R0_calc:.1f})')
-        
-        # Marcar o pico de infecção
-        pico_I = np.max(I)
-        dia_pico = t[np.argmax(I)]
-        plt.plot(dia_pico, pico_I, marker='o', color=cor, markersize=5)
-        plt.annotate(f'Pico: {pico_I:,.0f}', (dia_pico, pico_I * 1.05), color=cor, 
-                     fontsize=9, ha='center')
-
-    plt.title(f'Comparação de Cenários de Contágio (População Total N={N:,})', fontsize=14)
-    plt.xlabel('Tempo (Dias)', fontsize=12)
-    plt.ylabel('Número de Indivíduos Infectados (I)', fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.legend(loc='upper right')
-    plt.ylim(bottom=0)
-    plt.xlim(left=0)
+    t = results[0]["t"]
+    I_stack = np.stack([result["I"] for result in results]) # forma (K, T+1)
+    cores = [result["cor"] for result in results]
+
+    segmentos = np.stack([np.broadcast_to(t, I_stack.shape), I_stack], axis=-1)
+    ax.add_collection(LineCollection(segmentos, colors=cores, linewidths=3))
+    ax.autoscale_view()
+
+    # Marcar o pico de infecção de todos os cenários de uma vez
+    picos_I = I_stack.max(axis=1)
+    dias_pico = t[I_stack.argmax(axis=1)]
+    ax.scatter(dias_pico, picos_I, c=cores, s=25, zorder=3)
+
+    legendas = []
+    for result, cor, pico_I, dia_pico in zip(results, cores, picos_I, dias_pico):
+        # Calcular o R0 inicial para a legenda
+        R0_calc = result["beta"] / result["gamma"]
+        legendas.append(Line2D([], [], color=cor, linewidth=3,
+                               label=f'{result["nome"]} ($R_0$ inicial ≈ {R0_calc:.1f})'))
+        ax.annotate(f'Pico: {pico_I:,.0f}', (dia_pico, pico_I * 1.05), color=cor, 
+                    fontsize=9, ha='center')
+
+    ax.set_title(f'Comparação de Cenários de Contágio (População Total N={N:,})', fontsize=14)
+    ax.set_xlabel('Tempo (Dias)', fontsize=12)
+    ax.set_ylabel('Número de Indivíduos Infectados (I)', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend(handles=legendas, loc='upper right')
+    ax.set_ylim(bottom=0)
+    ax.set_xlim(left=0)
     
     # Salvar a figura
     filepath = os.path.join(output_dir, filename)
-    plt.savefig(filepath)
-    plt.close() # Fechar a figura para liberar memória
+    fig.savefig(filepath, **SAVEFIG_KWARGS)
+    if own_figure:
+        plt.close(fig) # Fechar a figura para liberar memória
     print(f"Gráfico de comparação salvo em: {filepath}")
 
+def _worker(i, data, t, S, I, R, output_dir):
+    """
+    Gera o gráfico individual de um cenário em um processo separado.
+
+    Os cenários são independentes, então cada um pode ser desenhado em paralelo.
+    Retorna apenas o índice do cenário; os arrays já estão no processo principal.
+    """
+    plot_single_sir_curve(t, S, I, R, data, output_dir, f"sir_cenario_{i+1}_individual.png")
+
+    return i
+
 
 # --- Execução Principal ---
 if __name__ == '__main__':
@@ -213,40 +699,37 @@ if __name__ == '__main__':
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    all_results = []
-    
     print("Iniciando simulações para os diferentes cenários...")
 
-    for i, data in enumerate(datas):
-        print(f"Simulando: {data['nome']}")
-        
-        # Verifica se há parâmetros de intervenção
-        intervencao_dia = data.get("intervencao_dia")
-        beta_pos_intervencao = data.get("beta_pos_intervencao")
-        
-        t, S, I, R = run_sir_model(
-            data["N"], 
-            data["I0"], 
-            data["R0_param"], 
-            data["beta"], 
-            data["gamma"], 
-            data["total_time"], 
-            data["time_steps"],
-            intervencao_dia,
-            beta_pos_intervencao
-        )
-        
-        # Armazena os resultados junto com metadados para o plot de comparação
-        all_results.append({
-            "t": t, "S": S, "I": I, "R": R, 
+    # Todos os cenários são resolvidos juntos; cada coluna é um cenário
+    # Resultados em cache são reaproveitados quando os parâmetros não mudaram
+    print(f"Simulando {len(datas)} cenários em lote: " + ", ".join(d["nome"] for d in datas))
+    t, S_all, I_all, R_all = run_sir_batch(datas, cache=True)
+
+    # Os gráficos individuais (etapa mais cara) são gerados em paralelo
+    max_workers = min(len(datas), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _worker, i, data, t, S_all[:, i], I_all[:, i], R_all[:, i], output_dir
+            )
+            for i, data in enumerate(datas)
+        ]
+        # Propaga eventuais erros dos processos trabalhadores
+        for future in as_completed(futures):
+            future.result()
+
+    # Armazena os resultados junto com metadados para o plot de comparação
+    all_results = [
+        {
+            "t": t, "S": S_all[:, i], "I": I_all[:, i], "R": R_all[:, i], 
             "nome": data["nome"], 
             "cor": data["cor"], 
             "beta": data["beta"],
             "gamma": data["gamma"]
-        })
-        
-        # NOVO: Plotar o gráfico individual S-I-R para este cenário
-        plot_single_sir_curve(t, S, I, R, data, output_dir, f"sir_cenario_{i+1}_individual.png")
+        }
+        for i, data in enumerate(datas)
+    ]
 
     # Plotar todos os cenários de Infectados em um único gráfico (comparação)
     N_total = datas[0]["N"]